@@ -56,66 +56,328 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_data():
-    """Load and cache the cleaned CORD-19 data"""
+# Columns of the cleaned export that the dashboard actually uses
+APP_COLUMNS = ['cord_uid', 'title', 'journal', 'publish_time', 'publication_year',
+               'source_x', 'has_abstract', 'abstract_length', 'title_word_count']
+
+def read_cleaned_data():
+    """Read the cleaned CORD-19 data, or sample data if it is not available"""
     try:
-        # Try to load the cleaned data from our analysis
-        df = pd.read_csv('cord19_cleaned_data.csv')
-        df['publish_time'] = pd.to_datetime(df['publish_time'])
+        # Try to load the cleaned data from our analysis (Parquet when
+        # pyarrow was available to the analysis script, CSV otherwise)
+        try:
+            # Typed binary columns, and only the ones the dashboard needs
+            # (an export without some of them loads whatever it has)
+            import pyarrow.parquet as pq
+            schema = pq.read_schema('cord19_cleaned_data.parquet')
+            columns = [col for col in APP_COLUMNS if col in schema.names]
+            df = pd.read_parquet('cord19_cleaned_data.parquet', engine='pyarrow', columns=columns)
+        except (FileNotFoundError, ImportError):
+            # Dates and categories are parsed by the reader; the export
+            # writes publish_time as ISO-8601, so no per-value format guessing
+            header = pd.read_csv('cord19_cleaned_data.csv', nrows=0).columns
+            columns = [col for col in APP_COLUMNS if col in header]
+            csv_options = dict(
+                usecols=columns,
+                parse_dates=[col for col in ['publish_time'] if col in columns],
+                date_format='ISO8601',
+                dtype={'journal': 'category', 'source_x': 'category'}
+            )
+            try:
+                # Multithreaded Arrow parser when pyarrow is installed
+                df = pd.read_csv('cord19_cleaned_data.csv', engine='pyarrow', **csv_options)
+            except ImportError:
+                df = pd.read_csv('cord19_cleaned_data.csv', **csv_options)
         return df
     except FileNotFoundError:
         # If cleaned data doesn't exist, create sample data
         return create_sample_data()
 
+@st.cache_data
+def load_data():
+    """
+    Load and cache the cleaned CORD-19 data along with the sidebar choices,
+    which never change after loading
+    Returns (df, journals, sources, year_min, year_max)
+    """
+    df = read_cleaned_data()
+    
+    # Low-cardinality text columns: compare, count and group on integer codes
+    for col in ('journal', 'source_x'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    # Plain NumPy booleans so the abstract filter can mask with the column as is
+    if 'has_abstract' in df.columns and df['has_abstract'].dtype != bool:
+        df['has_abstract'] = df['has_abstract'].fillna(False).astype(bool)
+    
+    journals = sources = []
+    year_min = year_max = None
+    if 'journal' in df.columns:
+        journals = np.sort(pd.unique(df['journal'].dropna().to_numpy())).tolist()
+    if 'source_x' in df.columns:
+        sources = np.sort(pd.unique(df['source_x'].dropna().to_numpy())).tolist()
+    if 'publication_year' in df.columns:
+        year_min = int(df['publication_year'].min())
+        year_max = int(df['publication_year'].max())
+    return df, journals, sources, year_min, year_max
+
 def create_sample_data():
-    """Create sample CORD-19 data for demonstration"""
-    np.random.seed(42)
+    """Create sample CORD-19 data for demonstration (whole columns at once, no per-row loop)"""
+    rng = np.random.default_rng(42)
     
     # Sample data similar to our analysis script
     journals = ['Nature', 'Science', 'Cell', 'Lancet', 'NEJM', 'JAMA', 'BMJ', 'PLoS ONE']
     sources = ['PMC', 'Medline', 'bioRxiv', 'medRxiv', 'ArXiv']
     
     n_papers = 2000
-    data = []
+    ids = np.arange(n_papers).astype(str).astype(object)
     
-    for i in range(n_papers):
-        # Generate realistic dates with COVID-19 research pattern
-        if np.random.random() < 0.1:
-            pub_date = pd.to_datetime('2019-12-01') + pd.Timedelta(days=np.random.randint(0, 31))
-        elif np.random.random() < 0.5:
-            pub_date = pd.to_datetime('2020-01-01') + pd.Timedelta(days=np.random.randint(0, 365))
-        elif np.random.random() < 0.8:
-            pub_date = pd.to_datetime('2021-01-01') + pd.Timedelta(days=np.random.randint(0, 365))
-        else:
-            pub_date = pd.to_datetime('2022-01-01') + pd.Timedelta(days=np.random.randint(0, 365))
-        
-        data.append({
-            'cord_uid': f'cord-{i:06d}',
-            'title': f'COVID-19 Research Study {i}: Analysis of Treatment and Prevention',
-            'abstract': f'This study examines COVID-19 treatment approaches...' if np.random.random() > 0.05 else np.nan,
-            'journal': np.random.choice(journals) if np.random.random() > 0.1 else np.nan,
-            'publish_time': pub_date,
-            'publication_year': pub_date.year,
-            'source_x': np.random.choice(sources),
-            'has_abstract': np.random.random() > 0.05,
-            'abstract_length': np.random.normal(250, 100) if np.random.random() > 0.05 else np.nan,
-            'title_word_count': np.random.randint(8, 15)
-        })
+    # Generate realistic dates with COVID-19 research pattern:
+    # 10% Dec 2019, 40% 2020, 30% 2021, 20% 2022
+    era = rng.choice(4, size=n_papers, p=[0.1, 0.4, 0.3, 0.2])
+    era_start = np.array(['2019-12-01', '2020-01-01', '2021-01-01', '2022-01-01'],
+                         dtype='datetime64[D]')
+    era_days = np.array([31, 365, 365, 365])
+    pub_dates = pd.to_datetime(era_start[era] + rng.integers(0, era_days[era]))
+    
+    def present(values, p_missing):
+        """Blank out a random share of values as NaN"""
+        return np.where(rng.random(n_papers) >= p_missing, values, np.nan)
+    
+    return pd.DataFrame({
+        'cord_uid': 'cord-' + np.char.zfill(ids.astype(str), 6).astype(object),
+        'title': 'COVID-19 Research Study ' + ids + ': Analysis of Treatment and Prevention',
+        'abstract': present(np.full(n_papers, 'This study examines COVID-19 treatment approaches...', dtype=object), 0.05),
+        'journal': present(rng.choice(np.array(journals, dtype=object), size=n_papers), 0.1),
+        'publish_time': pub_dates,
+        'publication_year': pub_dates.year,
+        'source_x': rng.choice(np.array(sources, dtype=object), size=n_papers),
+        'has_abstract': rng.random(n_papers) > 0.05,
+        'abstract_length': present(rng.normal(250, 100, size=n_papers), 0.05).astype(float),
+        'title_word_count': rng.integers(8, 15, size=n_papers)
+    })
+
+def apply_filters(df, year_range, selected_journal, selected_source, has_abstract_filter):
+    """Return the papers matching the sidebar filters"""
+    # Not cached: one fused mask is cheaper than pickling a copy of the
+    # filtered frame per filter combination into st.cache_data
+    # Combine all active conditions into one mask and slice the frame once;
+    # missing values (nullable/Arrow columns) never match a filter
+    conditions = []
+    
+    # Filter by year
+    if 'publication_year' in df.columns:
+        conditions.append(df['publication_year'].between(*year_range).to_numpy(dtype=bool, na_value=False))
+    
+    # Filter by journal
+    if selected_journal != 'All' and 'journal' in df.columns:
+        conditions.append((df['journal'] == selected_journal).to_numpy(dtype=bool, na_value=False))
+    
+    # Filter by source
+    if selected_source != 'All' and 'source_x' in df.columns:
+        conditions.append((df['source_x'] == selected_source).to_numpy(dtype=bool, na_value=False))
+    
+    # Filter by abstract availability
+    if has_abstract_filter and 'has_abstract' in df.columns:
+        conditions.append(df['has_abstract'].to_numpy(dtype=bool))
+    
+    if not conditions:
+        return df
+    return df.loc[np.logical_and.reduce(conditions)]
+
+# Cached aggregations behind the charts, so switching tabs or toggling
+# unrelated widgets does not recount the filtered data. Streamlit skips
+# hashing underscore-prefixed arguments; the small filter_key tuple
+# identifies the filtered frame instead of hashing all of its values
+@st.cache_data(show_spinner=False)
+def count_papers_by_year(_filtered_df, filter_key):
+    """Number of papers per publication year"""
+    # Years are small integers in a narrow range: a single bincount pass
+    # replaces hashing every row and sorting the result
+    years = _filtered_df['publication_year'].dropna().to_numpy(dtype=np.int64)
+    if len(years) == 0:
+        return pd.Series(dtype=np.int64)
+    year_min = years.min()
+    counts = pd.Series(np.bincount(years - year_min), index=np.arange(year_min, years.max() + 1))
+    return counts[counts > 0]
+
+@st.cache_data(show_spinner=False)
+def count_top_journals(_filtered_df, filter_key, n=15):
+    """The n journals with the most papers"""
+    counts = _filtered_df['journal'].value_counts().head(n)
+    # Categorical value_counts also lists journals filtered out entirely
+    return counts[counts > 0]
+
+@st.cache_data(show_spinner=False)
+def count_papers_by_source(_filtered_df, filter_key):
+    """Number of papers per research source"""
+    counts = _filtered_df['source_x'].value_counts()
+    return counts[counts > 0]
+
+@st.cache_data(show_spinner=False)
+def count_source_timeline(_filtered_df, filter_key):
+    """Papers per (publication year, source) pair in long form"""
+    # Years span a narrow range and sources are category codes, so one
+    # bincount over the flattened (year, source) grid replaces the hashed
+    # groupby; its non-zero cells come out ordered by year, then source
+    sources = _filtered_df['source_x'].cat.codes.to_numpy()
+    categories = _filtered_df['source_x'].cat.categories
+    valid = _filtered_df['publication_year'].notna().to_numpy() & (sources >= 0)
+    years = _filtered_df['publication_year'].to_numpy(dtype=np.int64, na_value=0)[valid]
+    if len(years) == 0:
+        return pd.DataFrame({'publication_year': [], 'source_x': [], 'count': []})
     
-    return pd.DataFrame(data)
+    year_min = years.min()
+    n_sources = len(categories)
+    grid = np.bincount((years - year_min) * n_sources + sources[valid],
+                       minlength=(years.max() - year_min + 1) * n_sources).reshape(-1, n_sources)
+    year_idx, source_idx = np.nonzero(grid)
+    return pd.DataFrame({
+        'publication_year': year_idx + year_min,
+        'source_x': categories[source_idx],
+        'count': grid[year_idx, source_idx]
+    })
+
+@st.cache_data(show_spinner=False)
+def count_papers_by_month(_filtered_df, filter_key):
+    """Number of papers per publication month"""
+    # Count the Periods themselves; only the few resulting labels become strings
+    monthly_counts = _filtered_df['publish_time'].dt.to_period('M').value_counts().sort_index()
+    monthly_counts.index = monthly_counts.index.astype(str)
+    return monthly_counts
+
+@st.cache_data(show_spinner=False)
+def most_common_value(_values, filter_key):
+    """Most frequent value of a series, or 'N/A' if it is empty"""
+    mode = _values.mode()
+    return mode.iat[0] if len(mode) > 0 else 'N/A'
+
+# Cached chart builders: they take the already-aggregated values as plain
+# tuples (cheap to hash), or raw values keyed by filter_key, so reruns
+# reuse the finished figure
+@st.cache_data(show_spinner=False)
+def make_year_bar(years, counts):
+    """Bar chart of papers per publication year"""
+    # go.Bar builds the trace directly, skipping px's DataFrame wrangling
+    fig = go.Figure(go.Bar(
+        x=years,
+        y=counts,
+        marker=dict(color=counts, colorscale='Viridis', showscale=True)
+    ))
+    fig.update_layout(
+        title="Publications by Year",
+        showlegend=False,
+        height=500,
+        xaxis_title="Publication Year",
+        yaxis_title="Number of Papers"
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_monthly_line(months, counts):
+    """Line chart of papers per publication month"""
+    # WebGL trace: rendered on the GPU in the browser
+    fig = go.Figure(go.Scattergl(
+        x=months,
+        y=counts,
+        mode='lines'
+    ))
+    fig.update_layout(
+        title="Monthly Publication Trends",
+        xaxis_title="Month",
+        yaxis_title="Number of Papers",
+        height=400
+    )
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_journal_bar(journals, counts):
+    """Horizontal bar chart of the top journals"""
+    fig = go.Figure(go.Bar(
+        y=journals,
+        x=counts,
+        orientation='h',
+        marker=dict(color=counts, colorscale='Plasma', showscale=True)
+    ))
+    fig.update_layout(
+        title="Top 15 Journals Publishing COVID-19 Research",
+        xaxis_title="Number of Papers",
+        yaxis_title="Journal",
+        height=600,
+        showlegend=False,
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_source_pie(sources, counts):
+    """Pie chart of papers per research source"""
+    fig = px.pie(
+        values=counts,
+        names=sources,
+        title="Distribution of Research Sources"
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_source_timeline(years, sources, counts):
+    """One line per source of papers per publication year"""
+    timeline = pd.DataFrame({'publication_year': years, 'source_x': sources, 'count': counts})
+    
+    # One WebGL line per source
+    fig = go.Figure()
+    for source, group in timeline.groupby('source_x', sort=False):
+        fig.add_trace(go.Scattergl(
+            x=group['publication_year'],
+            y=group['count'],
+            mode='lines',
+            name=str(source)
+        ))
+    fig.update_layout(
+        title="Publication Sources Over Time",
+        xaxis_title="Year",
+        yaxis_title="Number of Papers",
+        legend_title_text="Source",
+        height=400
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_abstract_histogram(_abstract_lengths, filter_key):
+    """Histogram of abstract lengths"""
+    fig = px.histogram(
+        x=_abstract_lengths,
+        nbins=30,
+        title="Distribution of Abstract Lengths",
+        labels={'x': 'Abstract Length (characters)', 'y': 'Number of Papers'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_title_box(_title_lengths, filter_key):
+    """Box plot of title word counts"""
+    fig = px.box(
+        y=_title_lengths,
+        title="Distribution of Title Word Counts",
+        labels={'y': 'Words in Title'}
+    )
+    fig.update_layout(height=400)
+    return fig
 
 # Load data
 with st.spinner('Loading CORD-19 research data...'):
-    df = load_data()
+    df, journal_options, source_options, year_min, year_max = load_data()
 
 # Sidebar for filters and controls
 st.sidebar.header("🔧 Data Filters & Controls")
 
 # Year range filter
 if 'publication_year' in df.columns:
-    year_min = int(df['publication_year'].min())
-    year_max = int(df['publication_year'].max())
     year_range = st.sidebar.slider(
         "📅 Select Publication Year Range",
         min_value=year_min,
@@ -128,14 +390,14 @@ else:
 
 # Journal filter
 if 'journal' in df.columns:
-    journals = ['All'] + sorted(df['journal'].dropna().unique().tolist())
+    journals = ['All'] + journal_options
     selected_journal = st.sidebar.selectbox("📚 Select Journal", journals)
 else:
     selected_journal = 'All'
 
 # Source filter
 if 'source_x' in df.columns:
-    sources = ['All'] + sorted(df['source_x'].dropna().unique().tolist())
+    sources = ['All'] + source_options
     selected_source = st.sidebar.selectbox("🔍 Select Source", sources)
 else:
     selected_source = 'All'
@@ -143,27 +405,9 @@ else:
 # Abstract availability filter
 has_abstract_filter = st.sidebar.checkbox("📝 Only papers with abstracts", value=False)
 
-# Apply filters
-filtered_df = df.copy()
-
-# Filter by year
-if 'publication_year' in filtered_df.columns:
-    filtered_df = filtered_df[
-        (filtered_df['publication_year'] >= year_range[0]) &
-        (filtered_df['publication_year'] <= year_range[1])
-    ]
-
-# Filter by journal
-if selected_journal != 'All' and 'journal' in filtered_df.columns:
-    filtered_df = filtered_df[filtered_df['journal'] == selected_journal]
-
-# Filter by source
-if selected_source != 'All' and 'source_x' in filtered_df.columns:
-    filtered_df = filtered_df[filtered_df['source_x'] == selected_source]
-
-# Filter by abstract availability
-if has_abstract_filter and 'has_abstract' in filtered_df.columns:
-    filtered_df = filtered_df[filtered_df['has_abstract'] == True]
+# Apply filters; filter_key identifies the result for the cached helpers below
+filter_key = (len(df), year_range, selected_journal, selected_source, has_abstract_filter)
+filtered_df = apply_filters(df, year_range, selected_journal, selected_source, has_abstract_filter)
 
 # Display filter results
 st.sidebar.markdown("---")
@@ -219,42 +463,20 @@ with tab1:
     
     if 'publication_year' in filtered_df.columns:
         # Annual publication counts
-        annual_counts = filtered_df['publication_year'].value_counts().sort_index()
+        annual_counts = count_papers_by_year(filtered_df, filter_key)
         
         # Create interactive plotly chart
-        fig = px.bar(
-            x=annual_counts.index,
-            y=annual_counts.values,
-            title="Publications by Year",
-            labels={'x': 'Publication Year', 'y': 'Number of Papers'},
-            color=annual_counts.values,
-            color_continuous_scale='viridis'
-        )
-        fig.update_layout(
-            showlegend=False,
-            height=500,
-            xaxis_title="Publication Year",
-            yaxis_title="Number of Papers"
-        )
+        fig = make_year_bar(tuple(annual_counts.index.tolist()), tuple(annual_counts.tolist()))
         st.plotly_chart(fig, use_container_width=True)
         
         # Monthly trend if we have enough data
         if len(filtered_df) > 50 and 'publish_time' in filtered_df.columns:
             st.subheader("📅 Monthly Publication Trends")
             
-            monthly_data = filtered_df.copy()
-            monthly_data['year_month'] = monthly_data['publish_time'].dt.to_period('M').astype(str)
-            monthly_counts = monthly_data['year_month'].value_counts().sort_index()
+            monthly_counts = count_papers_by_month(filtered_df, filter_key)
             
             if len(monthly_counts) > 1:
-                fig2 = px.line(
-                    x=monthly_counts.index,
-                    y=monthly_counts.values,
-                    title="Monthly Publication Trends",
-                    labels={'x': 'Month', 'y': 'Number of Papers'}
-                )
-                fig2.update_layout(height=400)
-                fig2.update_xaxes(tickangle=45)
+                fig2 = make_monthly_line(tuple(monthly_counts.index.tolist()), tuple(monthly_counts.tolist()))
                 st.plotly_chart(fig2, use_container_width=True)
     else:
         st.warning("Publication year data not available for timeline analysis.")
@@ -264,22 +486,9 @@ with tab2:
     
     if 'journal' in filtered_df.columns:
         # Top journals
-        top_journals = filtered_df['journal'].value_counts().head(15)
+        top_journals = count_top_journals(filtered_df, filter_key)
         
-        fig = px.bar(
-            y=top_journals.index,
-            x=top_journals.values,
-            orientation='h',
-            title="Top 15 Journals Publishing COVID-19 Research",
-            labels={'x': 'Number of Papers', 'y': 'Journal'},
-            color=top_journals.values,
-            color_continuous_scale='plasma'
-        )
-        fig.update_layout(
-            height=600,
-            showlegend=False,
-            yaxis={'categoryorder': 'total ascending'}
-        )
+        fig = make_journal_bar(tuple(top_journals.index.tolist()), tuple(top_journals.tolist()))
         st.plotly_chart(fig, use_container_width=True)
         
         # Journal statistics
@@ -323,33 +532,23 @@ with tab3:
     
     if 'source_x' in filtered_df.columns:
         # Source distribution
-        source_counts = filtered_df['source_x'].value_counts()
+        source_counts = count_papers_by_source(filtered_df, filter_key)
         
         # Pie chart for sources
-        fig = px.pie(
-            values=source_counts.values,
-            names=source_counts.index,
-            title="Distribution of Research Sources"
-        )
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        fig.update_layout(height=500)
+        fig = make_source_pie(tuple(source_counts.index.tolist()), tuple(source_counts.tolist()))
         st.plotly_chart(fig, use_container_width=True)
         
         # Source timeline
         if 'publication_year' in filtered_df.columns:
             st.subheader("📅 Source Trends Over Time")
             
-            source_timeline = filtered_df.groupby(['publication_year', 'source_x']).size().reset_index(name='count')
+            source_timeline = count_source_timeline(filtered_df, filter_key)
             
-            fig2 = px.line(
-                source_timeline,
-                x='publication_year',
-                y='count',
-                color='source_x',
-                title="Publication Sources Over Time",
-                labels={'publication_year': 'Year', 'count': 'Number of Papers', 'source_x': 'Source'}
+            fig2 = make_source_timeline(
+                tuple(source_timeline['publication_year'].tolist()),
+                tuple(source_timeline['source_x'].astype(str).tolist()),
+                tuple(source_timeline['count'].tolist())
             )
-            fig2.update_layout(height=400)
             st.plotly_chart(fig2, use_container_width=True)
     else:
         st.warning("Source data not available for analysis.")
@@ -365,13 +564,7 @@ with tab4:
             abstract_lengths = filtered_df['abstract_length'].dropna()
             
             if len(abstract_lengths) > 0:
-                fig = px.histogram(
-                    x=abstract_lengths,
-                    nbins=30,
-                    title="Distribution of Abstract Lengths",
-                    labels={'x': 'Abstract Length (characters)', 'y': 'Number of Papers'}
-                )
-                fig.update_layout(height=400)
+                fig = make_abstract_histogram(abstract_lengths.to_numpy(dtype=float), filter_key)
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Abstract statistics
@@ -384,10 +577,7 @@ with tab4:
                     <p><strong>Longest:</strong> {:.0f} characters</p>
                 </div>
                 """.format(
-                    abstract_lengths.mean(),
-                    abstract_lengths.median(),
-                    abstract_lengths.min(),
-                    abstract_lengths.max()
+                    *abstract_lengths.agg(['mean', 'median', 'min', 'max'])
                 ), unsafe_allow_html=True)
         else:
             st.info("Abstract length data not available.")
@@ -398,29 +588,25 @@ with tab4:
             title_lengths = filtered_df['title_word_count'].dropna()
             
             if len(title_lengths) > 0:
-                fig = px.box(
-                    y=title_lengths,
-                    title="Distribution of Title Word Counts",
-                    labels={'y': 'Words in Title'}
-                )
-                fig.update_layout(height=400)
+                fig = make_title_box(title_lengths.to_numpy(dtype=float), filter_key)
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Title statistics
+                title_stats = title_lengths.agg(['mean', 'median', 'min', 'max'])
                 st.markdown("""
                 <div class="insight-box">
                     <h4>📝 Title Statistics</h4>
                     <p><strong>Average Words:</strong> {:.1f}</p>
                     <p><strong>Median Words:</strong> {:.0f}</p>
                     <p><strong>Most Common Length:</strong> {} words</p>
-                    <p><strong>Range:</strong> {}-{} words</p>
+                    <p><strong>Range:</strong> {:.0f}-{:.0f} words</p>
                 </div>
                 """.format(
-                    title_lengths.mean(),
-                    title_lengths.median(),
-                    title_lengths.mode().iloc[0] if len(title_lengths.mode()) > 0 else 'N/A',
-                    title_lengths.min(),
-                    title_lengths.max()
+                    title_stats['mean'],
+                    title_stats['median'],
+                    most_common_value(title_lengths, filter_key),
+                    title_stats['min'],
+                    title_stats['max']
                 ), unsafe_allow_html=True)
         else:
             st.info("Title word count data not available.")
@@ -438,7 +624,7 @@ with st.expander("📋 View Sample Data"):
     if available_columns:
         sample_size = min(20, len(filtered_df))
         st.dataframe(
-            filtered_df[available_columns].head(sample_size),
+            filtered_df.iloc[:sample_size].loc[:, available_columns],
             use_container_width=True
         )
         st.caption(f"Showing {sample_size} of {len(filtered_df):,} papers")
@@ -467,20 +653,25 @@ with st.expander("📊 Dataset Summary"):
                 abstract_percentage = filtered_df['has_abstract'].mean() * 100
                 st.metric("Papers with Abstracts", f"{abstract_percentage:.1f}%")
         
-        # Missing data analysis
+        # Missing data analysis (computed only on request)
         st.markdown("#### Missing Data Analysis")
-        missing_data = filtered_df.isnull().sum()
-        missing_data = missing_data[missing_data > 0].sort_values(ascending=False)
-        
-        if len(missing_data) > 0:
-            missing_df = pd.DataFrame({
-                'Column': missing_data.index,
-                'Missing Count': missing_data.values,
-                'Percentage': (missing_data.values / len(filtered_df) * 100).round(1)
-            })
-            st.dataframe(missing_df, use_container_width=True)
-        else:
-            st.success("No missing data in the filtered dataset!")
+        if st.checkbox("Compute missing-data report"):
+            missing_counts = filtered_df.notna().sum().rsub(len(filtered_df)).to_numpy()
+            
+            # Top 20 columns with gaps: partition, then order only those
+            missing_cols = np.flatnonzero(missing_counts)
+            k = min(20, len(missing_cols))
+            if k > 0:
+                top = missing_cols[np.argpartition(-missing_counts[missing_cols], k - 1)[:k]]
+                top = top[np.argsort(-missing_counts[top], kind='stable')]
+                missing_df = pd.DataFrame({
+                    'Column': filtered_df.columns[top],
+                    'Missing Count': missing_counts[top],
+                    'Percentage': (missing_counts[top] / len(filtered_df) * 100).round(1)
+                })
+                st.dataframe(missing_df, use_container_width=True)
+            else:
+                st.success("No missing data in the filtered dataset!")
     else:
         st.warning("No data available with current filters.")
 